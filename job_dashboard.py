@@ -1,381 +1,525 @@
-import streamlit as st
-import pandas as pd
-import plotly.express as px
-import plotly.graph_objects as go
-from datetime import datetime, timedelta
-import re
-from collections import Counter
-import numpy as np
-
-# Page configuration
-st.set_page_config(
-    page_title="Job Market Dashboard",
-    page_icon="💼",
-    layout="wide",
-    initial_sidebar_state="expanded"
-)
-
-# Custom CSS for better styling
-st.markdown("""
-<style>
-    .main-header {
-        font-size: 3rem;
-        font-weight: bold;
-        text-align: center;
-        color: #1f77b4;
-        margin-bottom: 2rem;
-    }
-    .metric-container {
-        background-color: #f0f2f6;
-        padding: 1rem;
-        border-radius: 10px;
-        margin: 1rem 0;
-    }
-    .chart-container {
-        background-color: white;
-        padding: 1rem;
-        border-radius: 10px;
-        box-shadow: 0 2px 4px rgba(0,0,0,0.1);
-        margin: 1rem 0;
-    }
-</style>
-""", unsafe_allow_html=True)
-
-@st.cache_data
-def load_data(file_path):
-    """Load and process job data"""
-    try:
-        df = pd.read_csv(file_path)
-        
-        # Clean and process the data
-        df['title'] = df['title'].astype(str).str.strip()
-        df['company'] = df['company'].astype(str).str.strip()
-        df['location'] = df['location'].astype(str).str.strip()
-        df['source'] = df['source'].astype(str).str.strip()
-        
-        # Process skills column
-        df['skills_list'] = df['skills'].apply(parse_skills)
-        
-        # Process date_posted
-        df['date_posted'] = pd.to_datetime(df['date_posted'], errors='coerce')
-        df = df.dropna(subset=['date_posted'])
-        
-        # Extract city from location
-        df['city'] = df['location'].apply(extract_city)
-        
-        return df
-    except Exception as e:
-        st.error(f"Error loading data: {e}")
-        return None
-
-def parse_skills(skills_str):
-    """Parse skills string into a list"""
-    if pd.isna(skills_str) or skills_str == '' or skills_str == 'nan':
-        return []
-    
-    # Split by comma and clean each skill
-    skills = [skill.strip() for skill in str(skills_str).split(',')]
-    return [skill for skill in skills if skill and skill != 'nan']
-
-def extract_city(location_str):
-    """Extract city name from location string"""
-    if pd.isna(location_str) or location_str == '' or location_str == 'nan':
-        return 'Unknown'
-    
-    location_str = str(location_str).strip()
-    
-    # Handle common patterns
-    if location_str.lower() == 'remote':
-        return 'Remote'
-    
-    # Extract city from "City, State" or "City, Country" format
-    if ',' in location_str:
-        city = location_str.split(',')[0].strip()
-        return city if city else 'Unknown'
-    
-    return location_str
-
-def get_top_job_titles(df, n=5):
-    """Get top N most in-demand job titles"""
-    title_counts = df['title'].value_counts().head(n)
-    return title_counts
-
-def get_top_skills(df, n=10):
-    """Get top N most frequent skills"""
-    all_skills = []
-    for skills_list in df['skills_list']:
-        all_skills.extend(skills_list)
-    
-    skill_counts = Counter(all_skills)
-    return dict(skill_counts.most_common(n))
-
-def get_top_cities(df, n=10):
-    """Get cities with highest number of job openings"""
-    city_counts = df['city'].value_counts().head(n)
-    return city_counts
-
-def create_posting_trends(df):
-    """Create posting trends over time"""
-    # Group by date and count jobs
-    daily_counts = df.groupby(df['date_posted'].dt.date).size().reset_index()
-    daily_counts.columns = ['date', 'job_count']
-    daily_counts['date'] = pd.to_datetime(daily_counts['date'])
-    
-    return daily_counts
-
-def main():
-    # Header
-    st.markdown('<div class="main-header">💼 Job Market Dashboard</div>', unsafe_allow_html=True)
-    
-    # Sidebar
-    st.sidebar.header("📊 Dashboard Controls")
-    
-    # File upload
-    uploaded_file = st.sidebar.file_uploader(
-        "Upload CSV file",
-        type=['csv'],
-        help="Upload your job data CSV file"
-    )
-    
-    # Default file option
-    use_default = st.sidebar.checkbox("Use sample data", value=True)
-    
-    # Load data
-    df = None
-    if uploaded_file is not None:
-        df = load_data(uploaded_file)
-        use_default = False
-    elif use_default:
-        # Try to load default file
-        try:
-            df = load_data('linkedin_remoteok_jobs.csv')
-            if df is None:
-                st.info("📁 No default data file found. Please upload a CSV file to get started.")
-        except:
-            st.info("📁 No default data file found. Please upload a CSV file to get started.")
-    
-    if df is not None and not df.empty:
-        # Sidebar filters
-        st.sidebar.subheader("🔍 Filters")
-        
-        # Source filter
-        sources = ['All'] + list(df['source'].unique())
-        selected_source = st.sidebar.selectbox("Select Source", sources)
-        
-        # Date range filter
-        min_date = df['date_posted'].min().date()
-        max_date = df['date_posted'].max().date()
-        
-        date_range = st.sidebar.date_input(
-            "Date Range",
-            value=(min_date, max_date),
-            min_value=min_date,
-            max_value=max_date
-        )
-        
-        # Apply filters
-        filtered_df = df.copy()
-        
-        if selected_source != 'All':
-            filtered_df = filtered_df[filtered_df['source'] == selected_source]
-        
-        if len(date_range) == 2:
-            start_date, end_date = date_range
-            filtered_df = filtered_df[
-                (filtered_df['date_posted'].dt.date >= start_date) & 
-                (filtered_df['date_posted'].dt.date <= end_date)
-            ]
-        
-        # Main dashboard
-        if not filtered_df.empty:
-            # Key metrics
-            col1, col2, col3, col4 = st.columns(4)
-            
-            with col1:
-                st.metric("Total Jobs", len(filtered_df))
-            
-            with col2:
-                unique_companies = filtered_df['company'].nunique()
-                st.metric("Unique Companies", unique_companies)
-            
-            with col3:
-                unique_cities = filtered_df['city'].nunique()
-                st.metric("Cities", unique_cities)
-            
-            with col4:
-                date_range_days = (filtered_df['date_posted'].max() - filtered_df['date_posted'].min()).days
-                st.metric("Date Range (Days)", date_range_days)
-            
-            # Row 1: Top Job Titles and Skills
-            col1, col2 = st.columns(2)
-            
-            with col1:
-                st.subheader("🏆 Top 5 Most In-Demand Job Titles")
-                top_titles = get_top_job_titles(filtered_df, 5)
-                
-                if not top_titles.empty:
-                    fig = px.bar(
-                        x=top_titles.values,
-                        y=top_titles.index,
-                        orientation='h',
-                        title="Job Titles by Frequency",
-                        labels={'x': 'Number of Postings', 'y': 'Job Title'},
-                        color=top_titles.values,
-                        color_continuous_scale='Blues'
-                    )
-                    fig.update_layout(height=400, showlegend=False)
-                    st.plotly_chart(fig, use_container_width=True)
-                else:
-                    st.info("No job title data available")
-            
-            with col2:
-                st.subheader("💻 Most Frequent Skills Required")
-                top_skills = get_top_skills(filtered_df, 10)
-                
-                if top_skills:
-                    skills_df = pd.DataFrame(list(top_skills.items()), columns=['Skill', 'Count'])
-                    
-                    fig = px.bar(
-                        skills_df,
-                        x='Count',
-                        y='Skill',
-                        orientation='h',
-                        title="Skills by Frequency",
-                        labels={'Count': 'Number of Mentions', 'Skill': 'Skill'},
-                        color='Count',
-                        color_continuous_scale='Viridis'
-                    )
-                    fig.update_layout(height=400, showlegend=False)
-                    st.plotly_chart(fig, use_container_width=True)
-                    
-                    # Skills word frequency
-                    st.subheader("📋 Top Skills List")
-                    skills_text = ""
-                    for skill, count in list(top_skills.items())[:5]:
-                        skills_text += f"**{skill}**: {count} mentions  \n"
-                    st.markdown(skills_text)
-                else:
-                    st.info("No skills data available")
-            
-            # Row 2: Cities and Posting Trends
-            col1, col2 = st.columns(2)
-            
-            with col1:
-                st.subheader("🏙️ Cities with Highest Number of Openings")
-                top_cities = get_top_cities(filtered_df, 10)
-                
-                if not top_cities.empty:
-                    fig = px.pie(
-                        values=top_cities.values,
-                        names=top_cities.index,
-                        title="Job Distribution by City"
-                    )
-                    fig.update_traces(textposition='inside', textinfo='percent+label')
-                    fig.update_layout(height=400)
-                    st.plotly_chart(fig, use_container_width=True)
-                    
-                    # Top cities table
-                    st.subheader("📊 Top Cities Table")
-                    cities_df = pd.DataFrame({
-                        'City': top_cities.index,
-                        'Job Count': top_cities.values
-                    })
-                    st.dataframe(cities_df, use_container_width=True)
-                else:
-                    st.info("No city data available")
-            
-            with col2:
-                st.subheader("📈 Job Posting Trends Over Time")
-                trends_data = create_posting_trends(filtered_df)
-                
-                if not trends_data.empty:
-                    fig = px.line(
-                        trends_data,
-                        x='date',
-                        y='job_count',
-                        title="Daily Job Postings",
-                        labels={'date': 'Date', 'job_count': 'Number of Job Postings'}
-                    )
-                    fig.update_traces(line_color='#1f77b4', line_width=3)
-                    fig.update_layout(height=400)
-                    st.plotly_chart(fig, use_container_width=True)
-                    
-                    # Trends summary
-                    st.subheader("📊 Trends Summary")
-                    avg_daily = trends_data['job_count'].mean()
-                    max_daily = trends_data['job_count'].max()
-                    total_jobs = trends_data['job_count'].sum()
-                    
-                    st.markdown(f"""
-                    - **Average daily postings**: {avg_daily:.1f}
-                    - **Peak daily postings**: {max_daily}
-                    - **Total jobs in period**: {total_jobs}
-                    """)
-                else:
-                    st.info("No trends data available")
-            
-            # Additional insights
-            st.subheader("🔍 Additional Insights")
-            
-            col1, col2, col3 = st.columns(3)
-            
-            with col1:
-                st.subheader("📊 Jobs by Source")
-                source_counts = filtered_df['source'].value_counts()
-                fig = px.bar(
-                    x=source_counts.index,
-                    y=source_counts.values,
-                    title="Job Distribution by Source",
-                    labels={'x': 'Source', 'y': 'Number of Jobs'}
-                )
-                st.plotly_chart(fig, use_container_width=True)
-            
-            with col2:
-                st.subheader("📅 Jobs by Date Posted")
-                daily_jobs = filtered_df['date_posted'].dt.date.value_counts().sort_index()
-                fig = px.bar(
-                    x=daily_jobs.index,
-                    y=daily_jobs.values,
-                    title="Jobs Posted by Date",
-                    labels={'x': 'Date', 'y': 'Number of Jobs'}
-                )
-                st.plotly_chart(fig, use_container_width=True)
-            
-            with col3:
-                st.subheader("🏢 Top Companies")
-                top_companies = filtered_df['company'].value_counts().head(5)
-                company_text = ""
-                for company, count in top_companies.items():
-                    company_text += f"**{company}**: {count} jobs  \n"
-                st.markdown(company_text)
-            
-            # Raw data view
-            with st.expander("📋 View Raw Data"):
-                st.dataframe(filtered_df, use_container_width=True)
-                
-                # Download button
-                csv = filtered_df.to_csv(index=False)
-                st.download_button(
-                    label="Download filtered data as CSV",
-                    data=csv,
-                    file_name=f"filtered_jobs_{datetime.now().strftime('%Y%m%d_%H%M%S')}.csv",
-                    mime="text/csv"
-                )
-        
-        else:
-            st.warning("No data available for the selected filters.")
-    
-    else:
-        st.info("""
-        👋 Welcome to the Job Market Dashboard!
-        
-        To get started:
-        1. Upload your job data CSV file using the sidebar, or
-        2. Place your CSV file named 'linkedin_remoteok_jobs.csv' in the same directory
-        3. Check the 'Use sample data' option to load the default file
-        
-        The CSV should contain columns: title, company, location, date_posted, skills, source
-        """)
-
-if __name__ == "__main__":
+import streamlit as st
+import pandas as pd
+from datetime import datetime, timedelta
+import hashlib
+import os
+import re
+import numpy as np
+
+# Page configuration
+st.set_page_config(
+    page_title="Job Market Dashboard",
+    page_icon="💼",
+    layout="wide",
+    initial_sidebar_state="expanded"
+)
+
+# Custom CSS for better styling
+st.markdown("""
+<style>
+    .main-header {
+        font-size: 3rem;
+        font-weight: bold;
+        text-align: center;
+        color: #1f77b4;
+        margin-bottom: 2rem;
+    }
+    .metric-container {
+        background-color: #f0f2f6;
+        padding: 1rem;
+        border-radius: 10px;
+        margin: 1rem 0;
+    }
+    .chart-container {
+        background-color: white;
+        padding: 1rem;
+        border-radius: 10px;
+        box-shadow: 0 2px 4px rgba(0,0,0,0.1);
+        margin: 1rem 0;
+    }
+</style>
+""", unsafe_allow_html=True)
+
+# Only these columns are ever read from the CSV; anything else (e.g.
+# description, url) is pruned at parse time
+USECOLS = ['title', 'company', 'location', 'source', 'skills', 'date_posted']
+
+# Compiled once so chunked loads don't re-parse the pattern per chunk
+_SKILL_SEP_RE = re.compile(r'\s*,\s*')
+
+# CSVs larger than this are streamed chunk-by-chunk to cap peak memory
+CHUNK_THRESHOLD_BYTES = 250 * 1024 * 1024
+CHUNK_ROWS = 500_000
+
+# Cleaned frames are persisted here as Parquet so warm starts skip CSV
+# parsing and the skills/city derivation entirely
+CACHE_DIR = '.cache'
+
+def _parquet_cache_path(file_path):
+    """Cache file keyed by source path and mtime so edits invalidate it"""
+    try:
+        mtime = os.path.getmtime(file_path)
+    except OSError:
+        return None
+    digest = hashlib.md5(os.path.abspath(file_path).encode()).hexdigest()
+    return os.path.join(CACHE_DIR, f"{digest}_{int(mtime)}.parquet")
+
+@st.cache_resource
+def load_data(file_path):
+    """Load and process job data
+
+    Cached as a resource so the parsed frame is returned by reference
+    instead of being re-hashed on every access; callers must treat it
+    as read-only.
+    """
+    try:
+        cache_path = _parquet_cache_path(file_path) if isinstance(file_path, str) else None
+        if cache_path and os.path.exists(cache_path):
+            df = pd.read_parquet(cache_path, engine='pyarrow')
+            df.attrs['skills_exploded'] = df['skills_list'].explode().dropna()
+            return df
+
+        size = os.path.getsize(file_path) if isinstance(file_path, str) else 0
+        if size > CHUNK_THRESHOLD_BYTES:
+            # Stream large files so peak memory stays near one raw chunk
+            # plus the cleaned output, not the whole uncleaned file
+            reader = pd.read_csv(file_path, chunksize=CHUNK_ROWS, usecols=USECOLS)
+            df = pd.concat(
+                [_clean_jobs(chunk) for chunk in reader],
+                ignore_index=True, copy=False
+            )
+        else:
+            try:
+                # pyarrow's multithreaded CSV reader, with dates parsed at read time
+                df = pd.read_csv(file_path, engine='pyarrow', usecols=USECOLS,
+                                 parse_dates=['date_posted'])
+            except (ImportError, ValueError):
+                if hasattr(file_path, 'seek'):
+                    file_path.seek(0)
+                df = pd.read_csv(file_path, usecols=USECOLS)
+            df = _clean_jobs(df)
+
+        # Low-cardinality columns become categories so counts and filter
+        # comparisons run on integer codes (cast after concat so chunked
+        # reads share one category set)
+        for col in ('title', 'source', 'city', 'company'):
+            df[col] = df[col].astype('category')
+
+        # Day-floored timestamps so the date filter and daily grouping work
+        # on native datetime64 values instead of Python date objects
+        df['_day'] = df['date_posted'].dt.normalize()
+
+        if cache_path:
+            # Best-effort: a failed cache write should never break loading
+            try:
+                os.makedirs(CACHE_DIR, exist_ok=True)
+                df.to_parquet(cache_path, engine='pyarrow', compression='zstd')
+            except Exception:
+                pass
+
+        # Cache the exploded skills so repeated aggregations skip re-exploding
+        df.attrs['skills_exploded'] = df['skills_list'].explode().dropna()
+
+        return df
+    except Exception as e:
+        st.error(f"Error loading data: {e}")
+        return None
+
+def _clean_jobs(df):
+    """Clean one frame (or chunk) and derive the dashboard columns"""
+    for col in ('title', 'company', 'location', 'source'):
+        df[col] = df[col].astype('string').fillna('').str.strip()
+
+    # Process skills column (vectorized split instead of per-row apply)
+    skills = df['skills'].astype('string').fillna('')
+    skills = skills.str.replace(_SKILL_SEP_RE, ',', regex=True).str.strip()
+    df['skills_list'] = skills.str.split(',').map(
+        lambda lst: [s for s in lst if s and s != 'nan']
+    )
+
+    # Process date_posted
+    df['date_posted'] = pd.to_datetime(df['date_posted'], errors='coerce')
+    df = df.dropna(subset=['date_posted'])
+
+    # Extract city from location with branchless NumPy ops: partition at
+    # the first comma, then two np.where selects instead of the
+    # mask/fillna/replace chain
+    loc = df['location'].to_numpy(dtype=str)
+    city = np.char.strip(np.char.partition(loc, ',')[:, 0])
+    city = np.where(np.char.lower(loc) == 'remote', 'Remote', city)
+    df['city'] = np.where((city == '') | (city == 'nan'), 'Unknown', city)
+
+    return df
+
+# The aggregation helpers below are cached on the filter state (source,
+# date range and a key identifying the loaded frame); the frame itself is
+# passed as an underscore argument so Streamlit skips hashing it.
+
+@st.cache_data
+def get_sidebar_meta(_df, data_key):
+    """Source options and date bounds for the sidebar widgets"""
+    sources = ['All'] + sorted(_df['source'].unique().tolist())
+    return sources, _df['date_posted'].min().date(), _df['date_posted'].max().date()
+
+@st.cache_data
+def filter_jobs(_df, source, start_date, end_date, data_key):
+    """Filter the loaded frame by source and posting-date range"""
+    # Build one combined mask and index once instead of copying the frame
+    # and re-slicing it per condition
+    mask = np.ones(len(_df), dtype=bool)
+    if source != 'All':
+        mask &= (_df['source'] == source).to_numpy()
+    days = _df['_day'].to_numpy()
+    mask &= (days >= np.datetime64(start_date)) & (days <= np.datetime64(end_date))
+    return _df.loc[mask]
+
+def _counts_by_category(s):
+    """Frequency table via np.bincount on category codes (no hash table)"""
+    codes = s.cat.codes.to_numpy()
+    counts = np.bincount(codes[codes >= 0], minlength=len(s.cat.categories))
+    order = np.argsort(-counts, kind='stable')
+    counts = counts[order]
+    observed = counts > 0
+    return pd.Series(counts[observed], index=s.cat.categories[order][observed])
+
+@st.cache_data
+def get_count_tables(_df, source, start_date, end_date, data_key):
+    """Frequency tables for title/city/source/company, computed together"""
+    tables = {}
+    for col in ('title', 'city', 'source', 'company'):
+        s = _df[col]
+        if isinstance(s.dtype, pd.CategoricalDtype):
+            tables[col] = _counts_by_category(s)
+        else:
+            counts = s.value_counts()
+            tables[col] = counts[counts > 0]
+    return tables
+
+@st.cache_data
+def get_top_skills(_df, source, start_date, end_date, data_key, n=10):
+    """Get top N most frequent skills"""
+    exploded = _df.attrs.get('skills_exploded')
+    if exploded is not None:
+        # Exploded rows keep their source row label, so a filtered frame
+        # can reuse the series cached at load time via index membership
+        exploded = exploded[exploded.index.isin(_df.index)]
+    else:
+        exploded = _df['skills_list'].explode().dropna()
+
+    # Partial top-N selection: argpartition picks the n largest counts in
+    # O(U) instead of value_counts sorting every unique skill
+    vals, counts = np.unique(exploded.to_numpy(), return_counts=True)
+    if len(vals) == 0:
+        return {}
+    n = min(n, len(vals))
+    idx = np.argpartition(-counts, n - 1)[:n]
+    idx = idx[np.argsort(-counts[idx], kind='stable')]
+    return dict(zip(vals[idx].tolist(), counts[idx].tolist()))
+
+@st.cache_data
+def get_daily_counts(_df, source, start_date, end_date, data_key):
+    """Jobs per day, computed once and shared by the date-based charts"""
+    return _df.groupby('_day', sort=True).size()
+
+@st.cache_data
+def to_csv_bytes(_df, source, start_date, end_date, data_key):
+    """Serialize the filtered frame for download, cached per filter state"""
+    export = _df.drop(columns=['_day'], errors='ignore')
+    return export.to_csv(index=False).encode()
+
+@st.cache_data
+def create_posting_trends(_df, source, start_date, end_date, data_key):
+    """Create posting trends over time, downsampled for long ranges"""
+    counts = get_daily_counts(_df, source, start_date, end_date, data_key)
+
+    # Rebin long ranges so the browser never paints more than ~400 points
+    if not counts.empty:
+        span_days = (counts.index[-1] - counts.index[0]).days + 1
+        if span_days >= 2800:
+            counts = counts.resample('MS').sum()
+        elif span_days >= 400:
+            counts = counts.resample('W').sum()
+
+    trends = counts.reset_index()
+    trends.columns = ['date', 'job_count']
+
+    return trends
+
+def main():
+    # Header
+    st.markdown('<div class="main-header">💼 Job Market Dashboard</div>', unsafe_allow_html=True)
+    
+    # Sidebar
+    st.sidebar.header("📊 Dashboard Controls")
+    
+    # File upload
+    uploaded_file = st.sidebar.file_uploader(
+        "Upload CSV file",
+        type=['csv'],
+        help="Upload your job data CSV file"
+    )
+    
+    # Default file option
+    use_default = st.sidebar.checkbox("Use sample data", value=True)
+    
+    # Load data
+    df = None
+    if uploaded_file is not None:
+        df = load_data(uploaded_file)
+        use_default = False
+    elif use_default:
+        # Try to load default file
+        try:
+            df = load_data('linkedin_remoteok_jobs.csv')
+            if df is None:
+                st.info("📁 No default data file found. Please upload a CSV file to get started.")
+        except:
+            st.info("📁 No default data file found. Please upload a CSV file to get started.")
+    
+    if df is not None and not df.empty:
+        # Sidebar filters
+        st.sidebar.subheader("🔍 Filters")
+        
+        # Widget metadata is constant for a loaded frame, so compute it once
+        sources, min_date, max_date = get_sidebar_meta(df, id(df))
+
+        # Source filter
+        selected_source = st.sidebar.selectbox("Select Source", sources)
+
+        # Date range filter
+
+        date_range = st.sidebar.date_input(
+            "Date Range",
+            value=(min_date, max_date),
+            min_value=min_date,
+            max_value=max_date
+        )
+        
+        # Apply filters via the cached helper, keyed on the filter state
+        if len(date_range) == 2:
+            start_date, end_date = date_range
+        else:
+            start_date, end_date = min_date, max_date
+
+        filter_key = (selected_source, start_date, end_date, id(df))
+        filtered_df = filter_jobs(df, *filter_key)
+        
+        # Main dashboard
+        if not filtered_df.empty:
+            # Plotly is imported lazily so reruns that land on the upload
+            # prompt or no-data paths skip its import cost entirely
+            import plotly.express as px
+            import plotly.graph_objects as go
+
+            # One cached pass produces every per-column frequency table
+            # the charts below consume
+            count_tables = get_count_tables(filtered_df, *filter_key)
+
+            # Key metrics
+            col1, col2, col3, col4 = st.columns(4)
+            
+            with col1:
+                st.metric("Total Jobs", len(filtered_df))
+            
+            with col2:
+                unique_companies = len(count_tables['company'])
+                st.metric("Unique Companies", unique_companies)
+            
+            with col3:
+                unique_cities = len(count_tables['city'])
+                st.metric("Cities", unique_cities)
+            
+            with col4:
+                date_range_days = (filtered_df['date_posted'].max() - filtered_df['date_posted'].min()).days
+                st.metric("Date Range (Days)", date_range_days)
+            
+            # Row 1: Top Job Titles and Skills
+            col1, col2 = st.columns(2)
+            
+            with col1:
+                st.subheader("🏆 Top 5 Most In-Demand Job Titles")
+                top_titles = count_tables['title'].head(5)
+                
+                if not top_titles.empty:
+                    fig = px.bar(
+                        x=top_titles.values,
+                        y=top_titles.index,
+                        orientation='h',
+                        title="Job Titles by Frequency",
+                        labels={'x': 'Number of Postings', 'y': 'Job Title'},
+                        color=top_titles.values,
+                        color_continuous_scale='Blues'
+                    )
+                    fig.update_layout(height=400, showlegend=False)
+                    st.plotly_chart(fig, use_container_width=True)
+                else:
+                    st.info("No job title data available")
+            
+            with col2:
+                st.subheader("💻 Most Frequent Skills Required")
+                top_skills = get_top_skills(filtered_df, *filter_key, n=10)
+                
+                if top_skills:
+                    skills_df = pd.DataFrame(list(top_skills.items()), columns=['Skill', 'Count'])
+                    
+                    fig = px.bar(
+                        skills_df,
+                        x='Count',
+                        y='Skill',
+                        orientation='h',
+                        title="Skills by Frequency",
+                        labels={'Count': 'Number of Mentions', 'Skill': 'Skill'},
+                        color='Count',
+                        color_continuous_scale='Viridis'
+                    )
+                    fig.update_layout(height=400, showlegend=False)
+                    st.plotly_chart(fig, use_container_width=True)
+                    
+                    # Skills word frequency
+                    st.subheader("📋 Top Skills List")
+                    skills_text = ""
+                    for skill, count in list(top_skills.items())[:5]:
+                        skills_text += f"**{skill}**: {count} mentions  \n"
+                    st.markdown(skills_text)
+                else:
+                    st.info("No skills data available")
+            
+            # Row 2: Cities and Posting Trends
+            col1, col2 = st.columns(2)
+            
+            with col1:
+                st.subheader("🏙️ Cities with Highest Number of Openings")
+                top_cities = count_tables['city'].head(10)
+                
+                if not top_cities.empty:
+                    fig = px.bar(
+                        x=top_cities.values,
+                        y=top_cities.index,
+                        orientation='h',
+                        title="Job Distribution by City",
+                        labels={'x': 'Number of Openings', 'y': 'City'},
+                        color=top_cities.values,
+                        color_continuous_scale='Blues'
+                    )
+                    fig.update_layout(height=400, showlegend=False)
+                    st.plotly_chart(fig, use_container_width=True)
+                    
+                    # Top cities table
+                    st.subheader("📊 Top Cities Table")
+                    cities_df = pd.DataFrame({
+                        'City': top_cities.index,
+                        'Job Count': top_cities.values
+                    })
+                    st.dataframe(cities_df, use_container_width=True)
+                else:
+                    st.info("No city data available")
+            
+            with col2:
+                st.subheader("📈 Job Posting Trends Over Time")
+                trends_data = create_posting_trends(filtered_df, *filter_key)
+                
+                if not trends_data.empty:
+                    # Scattergl keeps the trend line on the WebGL path even
+                    # when the series grows to thousands of points
+                    fig = go.Figure(go.Scattergl(
+                        x=trends_data['date'],
+                        y=trends_data['job_count'],
+                        mode='lines',
+                        line=dict(color='#1f77b4', width=3)
+                    ))
+                    fig.update_layout(
+                        title="Daily Job Postings",
+                        xaxis_title='Date',
+                        yaxis_title='Number of Job Postings',
+                        height=400
+                    )
+                    st.plotly_chart(fig, use_container_width=True)
+                    
+                    # Trends summary
+                    st.subheader("📊 Trends Summary")
+                    avg_daily = trends_data['job_count'].mean()
+                    max_daily = trends_data['job_count'].max()
+                    total_jobs = trends_data['job_count'].sum()
+                    
+                    st.markdown(f"""
+                    - **Average daily postings**: {avg_daily:.1f}
+                    - **Peak daily postings**: {max_daily}
+                    - **Total jobs in period**: {total_jobs}
+                    """)
+                else:
+                    st.info("No trends data available")
+            
+            # Additional insights
+            st.subheader("🔍 Additional Insights")
+            
+            col1, col2, col3 = st.columns(3)
+            
+            with col1:
+                st.subheader("📊 Jobs by Source")
+                source_counts = count_tables['source']
+                fig = px.bar(
+                    x=source_counts.index,
+                    y=source_counts.values,
+                    title="Job Distribution by Source",
+                    labels={'x': 'Source', 'y': 'Number of Jobs'}
+                )
+                st.plotly_chart(fig, use_container_width=True)
+            
+            with col2:
+                st.subheader("📅 Jobs by Date Posted")
+                daily_jobs = get_daily_counts(filtered_df, *filter_key)
+                fig = px.bar(
+                    x=daily_jobs.index,
+                    y=daily_jobs.values,
+                    title="Jobs Posted by Date",
+                    labels={'x': 'Date', 'y': 'Number of Jobs'}
+                )
+                st.plotly_chart(fig, use_container_width=True)
+            
+            with col3:
+                st.subheader("🏢 Top Companies")
+                top_companies = count_tables['company'].head(5)
+                company_text = ""
+                for company, count in top_companies.items():
+                    company_text += f"**{company}**: {count} jobs  \n"
+                st.markdown(company_text)
+            
+            # Raw data view
+            with st.expander("📋 View Raw Data"):
+                # Send one page over the websocket instead of the whole frame
+                page_size = 100
+                pages = max((len(filtered_df) - 1) // page_size, 0)
+                page = st.number_input("Page", 0, pages, 0)
+                st.caption(f"{len(filtered_df)} rows, {page_size} per page")
+                st.dataframe(
+                    filtered_df.iloc[page * page_size:(page + 1) * page_size],
+                    use_container_width=True
+                )
+                
+                # Serialize only when asked, and cache the bytes per filter
+                # state instead of re-encoding the frame on every rerun
+                if st.button("Prepare download"):
+                    st.download_button(
+                        label="Download filtered data as CSV",
+                        data=to_csv_bytes(filtered_df, *filter_key),
+                        file_name=f"filtered_jobs_{datetime.now().strftime('%Y%m%d_%H%M%S')}.csv",
+                        mime="text/csv"
+                    )
+        
+        else:
+            st.warning("No data available for the selected filters.")
+    
+    else:
+        st.info("""
+        👋 Welcome to the Job Market Dashboard!
+        
+        To get started:
+        1. Upload your job data CSV file using the sidebar, or
+        2. Place your CSV file named 'linkedin_remoteok_jobs.csv' in the same directory
+        3. Check the 'Use sample data' option to load the default file
+        
+        The CSV should contain columns: title, company, location, date_posted, skills, source
+        """)
+
+if __name__ == "__main__":
     main()
\ No newline at end of file
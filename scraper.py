@@ -1,11 +1,20 @@
+import sys
 import requests
-from bs4 import BeautifulSoup
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
+from bs4 import BeautifulSoup, SoupStrainer
+import soupsieve as sv
+import numpy as np
 import pandas as pd
 import json
 import time
-import random
+from collections import Counter
 from datetime import datetime, timedelta
 import re
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass, asdict
+from functools import lru_cache
 from urllib.parse import urljoin, quote_plus
 import logging
 from typing import List, Dict, Optional
@@ -15,100 +24,277 @@ import csv
 logging.basicConfig(level=logging.INFO, format='%(asctime)s - %(levelname)s - %(message)s')
 logger = logging.getLogger(__name__)
 
+# lxml's C parser is several times faster than the pure-Python default;
+# keep html.parser as a fallback so the scraper still runs without it
+try:
+    import lxml  # noqa: F401
+    _BS_PARSER = 'lxml'
+except ImportError:
+    _BS_PARSER = 'html.parser'
+
+# Only the job-card/row subtrees are turned into Python tree objects;
+# the rest of each page is discarded during parsing
+_LI_CARD_STRAINER = SoupStrainer('div', class_='base-card')
+_ROK_ROW_STRAINER = SoupStrainer('tr', class_='job')
+
+# CSS selectors compiled once at import instead of being re-resolved for
+# every card/row inside the scrape loops
+_LI_CARDS = sv.compile('div.base-card')
+_LI_TITLE = sv.compile('h3.base-search-card__title')
+_LI_COMPANY = sv.compile('h4.base-search-card__subtitle')
+_LI_COMPANY_LINK = sv.compile('a[data-tracking-control-name="public_jobs_topcard-org-name"]')
+_LI_LOCATION = sv.compile('span.job-search-card__location')
+_LI_DATE = sv.compile('time.job-search-card__listdate')
+_LI_ANY_TIME = sv.compile('time')
+_LI_LINK = sv.compile('a.base-card__full-link')
+_LI_SNIPPET = sv.compile('p.job-search-card__snippet')
+
+_ROK_ROWS = sv.compile('tr.job')
+_ROK_TITLE = sv.compile('td.company h2, h2[itemprop="title"]')
+_ROK_COMPANY = sv.compile('td.company h3, h3[itemprop="name"]')
+_ROK_TAGS = sv.compile('td.tags a.tag h3, td.tags span.tag h3')
+_ROK_DATE = sv.compile('td.time time')
+
+# Skill keywords matched against job descriptions
+SKILL_KEYWORDS = [
+    # Programming Languages
+    'python', 'java', 'javascript', 'typescript', 'c#', 'c++', 'php', 'ruby', 'go', 'swift', 'kotlin', 'scala', 'rust', 'perl',
+    # Web Development (Frontend)
+    'html', 'css', 'react', 'angular', 'vue', 'jquery', 'bootstrap', 'tailwind', 'sass', 'less', 'svelte',
+    # Web Development (Backend)
+    'nodejs', 'django', 'flask', 'spring', 'ruby on rails', '.net', 'laravel', 'express',
+    # Databases
+    'sql', 'mysql', 'postgresql', 'sqlite', 'mongodb', 'redis', 'cassandra', 'elasticsearch', 'dynamodb', 'oracle', 'sql server',
+    # Cloud Platforms
+    'aws', 'azure', 'gcp', 'google cloud', 'amazon web services', 'heroku', 'digitalocean', 'kubernetes', 'docker', 'terraform',
+    # DevOps & Tools
+    'git', 'github', 'gitlab', 'jenkins', 'ansible', 'puppet', 'chef', 'ci/cd', 'jira', 'linux', 'bash',
+    # Data Science & ML
+    'machine learning', 'data science', 'artificial intelligence', 'ai', 'deep learning', 'nlp',
+    'pandas', 'numpy', 'scipy', 'scikit-learn', 'tensorflow', 'pytorch', 'keras', 'spark', 'hadoop',
+    # Mobile Development
+    'ios', 'android', 'react native', 'flutter',
+    # Other
+    'api', 'rest', 'graphql', 'microservices', 'agile', 'scrum'
+]
+
+# Canonical display capitalization for each matched keyword
+_UPPER_SKILLS = {'aws', 'gcp', 'ai', 'html', 'css', 'sql', 'api', 'ci/cd', 'nlp'}
+_SPECIAL_SKILLS = {'c#': 'C#', 'c++': 'C++', 'javascript': 'JavaScript', 'nodejs': 'Node.js'}
+CANONICAL_SKILLS = {
+    skill: (skill.upper() if skill in _UPPER_SKILLS
+            else _SPECIAL_SKILLS.get(skill, skill.title()))
+    for skill in SKILL_KEYWORDS
+}
+
+# One Aho-Corasick automaton finds every keyword in a single pass over the
+# text; fall back to per-keyword regex scans if the extension is missing
+try:
+    import ahocorasick
+    _SKILL_AUTOMATON = ahocorasick.Automaton()
+    for _skill in SKILL_KEYWORDS:
+        _SKILL_AUTOMATON.add_word(_skill, (len(_skill), CANONICAL_SKILLS[_skill]))
+    _SKILL_AUTOMATON.make_automaton()
+except ImportError:
+    _SKILL_AUTOMATON = None
+
+# Fallback for environments without pyahocorasick: one compiled
+# alternation (longest keywords first so 'ruby on rails' wins over
+# 'ruby') still scans the text once instead of once per keyword.
+# google-re2 compiles this to a DFA when available.
+_SKILL_PATTERN = r"\b(?:" + "|".join(
+    re.escape(skill) for skill in sorted(SKILL_KEYWORDS, key=len, reverse=True)
+) + r")\b"
+try:
+    import re2
+    _SKILL_RE = re2.compile(_SKILL_PATTERN)
+except ImportError:
+    _SKILL_RE = re.compile(_SKILL_PATTERN)
+
+@lru_cache(maxsize=4096)
+def _scan_skills(description_lower: str) -> tuple:
+    """Match skill keywords in pre-lowercased text
+
+    Cached because scraped descriptions are built from a handful of
+    templates, so repeat strings are the common case. Returns a sorted
+    tuple (immutable, safe to share between cache hits).
+    """
+    found_skills = set()
+
+    if _SKILL_AUTOMATON is not None:
+        # Single multi-pattern pass over the text instead of one regex
+        # scan per keyword
+        for end, (length, canonical) in _SKILL_AUTOMATON.iter(description_lower):
+            if _word_boundary(description_lower, end - length + 1, end):
+                found_skills.add(canonical)
+    else:
+        for match in _SKILL_RE.findall(description_lower):
+            found_skills.add(CANONICAL_SKILLS[match])
+
+    return tuple(sorted(found_skills))
+
+# orjson decodes the RemoteOK API payload several times faster than the
+# stdlib parser; fall back to json.loads when it isn't installed
+try:
+    import orjson
+    _json_loads = orjson.loads
+except ImportError:
+    _json_loads = json.loads
+
+# parse_date machinery, compiled once: _REL_RE finds the relative-date
+# keyword ('yesterday' is listed before 'day' so it wins), _REL_FIXED
+# holds constant offsets and _REL_SCALED builds count-scaled ones
+_NUM_RE = re.compile(r"\d+")
+_REL_RE = re.compile(r"just now|today|hour|minute|yesterday|day|week|month")
+_REL_FIXED = {
+    'just now': timedelta(0),
+    'today': timedelta(0),
+    'hour': timedelta(0),
+    'minute': timedelta(0),
+    'yesterday': timedelta(days=1),
+}
+_REL_SCALED = {
+    'day': lambda n: timedelta(days=n),
+    'week': lambda n: timedelta(weeks=n),
+    'month': lambda n: timedelta(days=n * 30),
+}
+
+def _word_boundary(text: str, start: int, end: int) -> bool:
+    """Reject matches glued to adjacent alphanumeric characters"""
+    if start > 0 and text[start - 1].isalnum():
+        return False
+    if end + 1 < len(text) and text[end + 1].isalnum():
+        return False
+    return True
+
+class _TokenBucket:
+    """Per-host politeness limiter.
+
+    Refills at ``rate`` tokens per second; acquire() sleeps only for the
+    shortfall instead of a fixed random pause, so the wait on one host
+    can overlap useful work against another.
+    """
+
+    def __init__(self, rate: float, capacity: float = 1.0):
+        self.rate = rate
+        self.capacity = capacity
+        self._tokens = capacity
+        self._last = time.monotonic()
+        self._lock = threading.Lock()
+
+    def acquire(self):
+        with self._lock:
+            now = time.monotonic()
+            self._tokens = min(self.capacity,
+                               self._tokens + (now - self._last) * self.rate)
+            self._last = now
+            self._tokens -= 1.0
+            wait = -self._tokens / self.rate if self._tokens < 0 else 0.0
+        if wait > 0:
+            time.sleep(wait)
+
+@dataclass(slots=True)
+class Job:
+    """One scraped job posting
+
+    Slots keep per-record memory flat and make attribute access a fixed
+    offset lookup instead of a dict probe.
+    """
+    title: str
+    company: str
+    location: str
+    date_posted: str
+    skills: List[str]
+    source: str
+    description: str
+    url: str = ""
+
 class JobScraper:
     def __init__(self):
-        self.delay_range = (3, 6)
         self.jobs_data = []
-        
-    def random_delay(self, multiplier=1.0):
-        """Add random delay between requests to be respectful"""
-        delay = random.uniform(*self.delay_range) * multiplier
-        logger.info(f"Waiting for {delay:.2f} seconds...")
-        time.sleep(delay)
+
+        # Per-host token buckets instead of blanket sleeps: roughly one
+        # request every 4.5s against each host, enforced independently
+        self._buckets = {
+            'linkedin.com': _TokenBucket(rate=1 / 4.5),
+            'remoteok.com': _TokenBucket(rate=1 / 4.5),
+        }
+
+        # One pooled session shared by every scraper: keep-alive avoids a
+        # TCP/TLS handshake per page and retries get backoff for free
+        self.session = requests.Session()
+        adapter = HTTPAdapter(
+            pool_connections=4,
+            pool_maxsize=16,
+            max_retries=Retry(total=3, backoff_factor=0.5),
+        )
+        self.session.mount('https://', adapter)
+        self.session.mount('http://', adapter)
+        self.session.headers.update({
+            'User-Agent': 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/120.0.0.0 Safari/537.36',
+            'Accept': 'text/html,application/xhtml+xml,application/xml;q=0.9,image/webp,*/*;q=0.8',
+            'Accept-Language': 'en-US,en;q=0.9',
+            'Accept-Encoding': 'gzip, deflate, br',
+            'Connection': 'keep-alive',
+            'Upgrade-Insecure-Requests': '1',
+        })
 
     def clean_text(self, text: str) -> str:
         """Clean and normalize text data"""
         if not text:
             return ""
-        text = text.replace("\n", " ").replace("\t", " ")
-        return " ".join(text.strip().split())
+        # str.split with no argument eats any whitespace run in one
+        # C-level pass; measurably faster than a regex sub on the short
+        # strings this sees
+        return " ".join(text.split())
 
     def extract_skills(self, description: str) -> List[str]:
         """Extract skills from job description using keyword matching"""
         if not description:
             return []
-        
-        skill_keywords = [
-            # Programming Languages
-            'python', 'java', 'javascript', 'typescript', 'c#', 'c++', 'php', 'ruby', 'go', 'swift', 'kotlin', 'scala', 'rust', 'perl', 
-            # Web Development (Frontend)
-            'html', 'css', 'react', 'angular', 'vue', 'jquery', 'bootstrap', 'tailwind', 'sass', 'less', 'svelte',
-            # Web Development (Backend)
-            'nodejs', 'django', 'flask', 'spring', 'ruby on rails', '.net', 'laravel', 'express',
-            # Databases
-            'sql', 'mysql', 'postgresql', 'sqlite', 'mongodb', 'redis', 'cassandra', 'elasticsearch', 'dynamodb', 'oracle', 'sql server',
-            # Cloud Platforms
-            'aws', 'azure', 'gcp', 'google cloud', 'amazon web services', 'heroku', 'digitalocean', 'kubernetes', 'docker', 'terraform',
-            # DevOps & Tools
-            'git', 'github', 'gitlab', 'jenkins', 'ansible', 'puppet', 'chef', 'ci/cd', 'jira', 'linux', 'bash',
-            # Data Science & ML
-            'machine learning', 'data science', 'artificial intelligence', 'ai', 'deep learning', 'nlp', 
-            'pandas', 'numpy', 'scipy', 'scikit-learn', 'tensorflow', 'pytorch', 'keras', 'spark', 'hadoop',
-            # Mobile Development
-            'ios', 'android', 'react native', 'flutter',
-            # Other
-            'api', 'rest', 'graphql', 'microservices', 'agile', 'scrum'
-        ]
-        
-        description_lower = description.lower()
-        found_skills = set()
-        
-        for skill in skill_keywords:
-            pattern = r"\b" + re.escape(skill.lower()) + r"\b"
-            if re.search(pattern, description_lower):
-                # Proper capitalization
-                if skill.upper() in ["AWS", "GCP", "AI", "HTML", "CSS", "SQL", "API", "CI/CD", "NLP"]:
-                    found_skills.add(skill.upper())
-                elif skill == "c#":
-                    found_skills.add("C#")
-                elif skill == "c++":
-                    found_skills.add("C++")
-                elif skill == "javascript":
-                    found_skills.add("JavaScript")
-                elif skill == "nodejs":
-                    found_skills.add("Node.js")
-                else:
-                    found_skills.add(skill.title())
+        return self._extract_skills_lower(description.lower())
 
-        return sorted(list(found_skills))
+    def _extract_skills_lower(self, description_lower: str) -> List[str]:
+        """Skill scan for text that is already lowercased.
+
+        Scrapers that need the lowered description for other work fold the
+        case once at the call site and come in here, avoiding a second
+        full-string copy per job.
+        """
+        if not description_lower:
+            return []
+        return list(_scan_skills(description_lower))
 
     def parse_date(self, date_str: str) -> str:
         """Parse and normalize date strings from various formats"""
         if not date_str:
             return datetime.now().strftime("%Y-%m-%d")
-        
+
+        # Fast path: LinkedIn's <time datetime=...> attribute is already
+        # ISO-shaped, so two character checks settle the common case
+        # before any lowering or keyword scanning
+        if len(date_str) >= 10 and date_str[4] == '-' and date_str[7] == '-':
+            try:
+                return datetime.fromisoformat(date_str[:10]).strftime("%Y-%m-%d")
+            except ValueError:
+                pass
+
         date_str = date_str.lower().strip().replace("posted", "").replace("on", "").strip()
         now = datetime.now()
 
         try:
-            # Handle relative dates
-            if "just now" in date_str or "today" in date_str or "hour" in date_str or "minute" in date_str:
-                return now.strftime("%Y-%m-%d")
-            elif "yesterday" in date_str:
-                return (now - timedelta(days=1)).strftime("%Y-%m-%d")
-            elif "day" in date_str:
-                days_match = re.search(r"(\d+)", date_str)
-                if days_match:
-                    return (now - timedelta(days=int(days_match.group(1)))).strftime("%Y-%m-%d")
-            elif "week" in date_str:
-                weeks_match = re.search(r"(\d+)", date_str)
-                if weeks_match:
-                    return (now - timedelta(weeks=int(weeks_match.group(1)))).strftime("%Y-%m-%d")
-            elif "month" in date_str:
-                months_match = re.search(r"(\d+)", date_str)
-                if months_match:
-                    return (now - timedelta(days=int(months_match.group(1)) * 30)).strftime("%Y-%m-%d")
-            
+            # Handle relative dates: one precompiled keyword scan plus a
+            # dispatch lookup instead of the substring if/elif ladder
+            rel_match = _REL_RE.search(date_str)
+            if rel_match:
+                keyword = rel_match.group()
+                if keyword in _REL_FIXED:
+                    return (now - _REL_FIXED[keyword]).strftime("%Y-%m-%d")
+                num_match = _NUM_RE.search(date_str)
+                if num_match:
+                    delta = _REL_SCALED[keyword](int(num_match.group()))
+                    return (now - delta).strftime("%Y-%m-%d")
+
             # Handle ISO dates
             try:
                 if 'T' in date_str or '+' in date_str:
@@ -124,73 +310,71 @@ class JobScraper:
             logger.error(f"Date parsing failed for '{date_str}': {e}")
             return now.strftime("%Y-%m-%d")
 
-    def scrape_linkedin_jobs(self, query: str = "software engineer", location: str = "United States", max_jobs: int = 50) -> List[Dict]:
+    def scrape_linkedin_jobs(self, query: str = "software engineer", location: str = "United States", max_jobs: int = 50) -> List[Job]:
         """Scrape jobs from LinkedIn using requests (public job listings)"""
         logger.info(f"Scraping LinkedIn for '{query}' in '{location}' (max_jobs={max_jobs})")
         jobs = []
-        session = requests.Session()
-        
+
         try:
-            # Set up session with headers
-            headers = {
-                'User-Agent': 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/120.0.0.0 Safari/537.36',
-                'Accept': 'text/html,application/xhtml+xml,application/xml;q=0.9,image/webp,*/*;q=0.8',
-                'Accept-Language': 'en-US,en;q=0.5',
-                'Accept-Encoding': 'gzip, deflate, br',
-                'Connection': 'keep-alive',
-                'Upgrade-Insecure-Requests': '1',
-            }
-            session.headers.update(headers)
-            
-            # LinkedIn job search URL (public listings)
-            start = 0
+            # LinkedIn public job search URLs, built upfront so the pages
+            # can be fetched concurrently
             page_size = 25
             pages_to_scrape = min(3, (max_jobs // page_size) + 1)
-            
-            for page in range(pages_to_scrape):
+            base_url = (
+                f"https://www.linkedin.com/jobs/search?keywords={quote_plus(query)}"
+                f"&location={quote_plus(location)}&f_TPR=r604800"
+            )
+            urls = [f"{base_url}&start={page * page_size}" for page in range(pages_to_scrape)]
+
+            def fetch(page_url):
+                self._buckets['linkedin.com'].acquire()
+                logger.info(f"Fetching LinkedIn page: {page_url}")
+                # Stream the body straight into the parser: decode_content
+                # undoes the gzip/br transfer encoding on the raw file
+                # object, so the page is parsed as bytes arrive instead of
+                # being materialized as a separate decoded copy first
+                with self.session.get(page_url, timeout=30, stream=True) as response:
+                    response.raise_for_status()
+                    response.raw.decode_content = True
+                    return BeautifulSoup(response.raw, _BS_PARSER,
+                                         parse_only=_LI_CARD_STRAINER)
+
+            # The page GETs are independent, so issue them in parallel over
+            # the pooled session and parse the results in page order
+            with ThreadPoolExecutor(max_workers=3) as pool:
+                soups = list(pool.map(fetch, urls))
+
+            for page, (url, soup) in enumerate(zip(urls, soups)):
                 if len(jobs) >= max_jobs:
                     break
-                    
-                # LinkedIn public job search URL
-                url = f"https://www.linkedin.com/jobs/search?keywords={quote_plus(query)}&location={quote_plus(location)}&start={start}&f_TPR=r604800"
-                logger.info(f"Fetching LinkedIn page {page + 1}: {url}")
-                
-                response = session.get(url, timeout=30)
-                response.raise_for_status()
-                
-                soup = BeautifulSoup(response.content, 'html.parser')
-                
+
                 # Find job cards
-                job_cards = soup.find_all('div', class_='base-card')
+                job_cards = _LI_CARDS.select(soup)
                 logger.info(f"Found {len(job_cards)} job cards on page {page + 1}")
-                
+
                 if not job_cards:
                     logger.warning("No job cards found. LinkedIn structure may have changed.")
                     break
-                
+
                 for card in job_cards:
                     if len(jobs) >= max_jobs:
                         break
                         
                     try:
                         # Extract job title
-                        title_elem = card.find('h3', class_='base-search-card__title')
+                        title_elem = _LI_TITLE.select_one(card)
                         title = self.clean_text(title_elem.get_text() if title_elem else "")
-                        
+
                         # Extract company name
-                        company_elem = card.find('h4', class_='base-search-card__subtitle')
-                        if not company_elem:
-                            company_elem = card.find('a', {'data-tracking-control-name': 'public_jobs_topcard-org-name'})
+                        company_elem = _LI_COMPANY.select_one(card) or _LI_COMPANY_LINK.select_one(card)
                         company = self.clean_text(company_elem.get_text() if company_elem else "")
-                        
+
                         # Extract location
-                        location_elem = card.find('span', class_='job-search-card__location')
+                        location_elem = _LI_LOCATION.select_one(card)
                         job_location = self.clean_text(location_elem.get_text() if location_elem else location)
-                        
+
                         # Extract date
-                        date_elem = card.find('time', class_='job-search-card__listdate')
-                        if not date_elem:
-                            date_elem = card.find('time')
+                        date_elem = _LI_DATE.select_one(card) or _LI_ANY_TIME.select_one(card)
                         date_posted = ""
                         if date_elem:
                             date_posted = self.parse_date(date_elem.get('datetime', '') or date_elem.get_text())
@@ -198,7 +382,7 @@ class JobScraper:
                             date_posted = self.parse_date("")
                         
                         # Extract job link for description
-                        link_elem = card.find('a', class_='base-card__full-link')
+                        link_elem = _LI_LINK.select_one(card)
                         job_url = ""
                         if link_elem and link_elem.get('href'):
                             job_url = urljoin(url, link_elem['href'])
@@ -207,60 +391,105 @@ class JobScraper:
                         description = f"LinkedIn job posting for {title} at {company}. Location: {job_location}."
                         
                         # Try to get job snippet if available
-                        snippet_elem = card.find('p', class_='job-search-card__snippet')
+                        snippet_elem = _LI_SNIPPET.select_one(card)
                         if snippet_elem:
                             description += " " + self.clean_text(snippet_elem.get_text())
                         
                         # Extract skills from description
-                        skills = self.extract_skills(description)
+                        skills = self._extract_skills_lower(description.lower())
                         
                         if title and company:
-                            job = {
-                                'title': title,
-                                'company': company,
-                                'location': job_location,
-                                'date_posted': date_posted,
-                                'skills': skills,
-                                'source': 'LinkedIn',
-                                'description': description[:500] + "..." if len(description) > 500 else description,
-                                'url': job_url
-                            }
+                            job = Job(
+                                title=title,
+                                company=sys.intern(company),
+                                location=sys.intern(job_location),
+                                date_posted=sys.intern(date_posted),
+                                skills=skills,
+                                source='LinkedIn',
+                                description=description[:500] + "..." if len(description) > 500 else description,
+                                url=job_url
+                            )
                             jobs.append(job)
                             logger.debug(f"Added job: {title} at {company}")
                     
                     except Exception as e:
                         logger.warning(f"Error parsing LinkedIn job card: {e}")
                         continue
-                
-                start += page_size
-                if page < pages_to_scrape - 1:  # Don't delay after last page
-                    self.random_delay(0.8)
-                    
+
         except requests.exceptions.RequestException as e:
             logger.error(f"Error fetching LinkedIn data: {e}")
         except Exception as e:
             logger.error(f"Error scraping LinkedIn: {e}")
-        finally:
-            session.close()
-        
+
         logger.info(f"Successfully scraped {len(jobs)} jobs from LinkedIn")
         return jobs
 
-    def scrape_remoteok(self, query: str = "software", max_jobs: int = 50) -> List[Dict]:
+    def _scrape_remoteok_api(self, max_jobs: int) -> List[Job]:
+        """Fetch RemoteOK listings from its JSON API.
+
+        The API returns the same postings as the HTML table as structured
+        JSON, so no HTML parsing or selector fallbacks are needed. The
+        first array element is a legal notice, not a job.
+        """
+        self._buckets['remoteok.com'].acquire()
+        response = self.session.get(
+            'https://remoteok.com/api', timeout=30,
+            headers={'Accept': 'application/json'}
+        )
+        response.raise_for_status()
+        data = _json_loads(response.content)
+
+        jobs = []
+        for row in data[1:]:
+            if len(jobs) >= max_jobs:
+                break
+
+            title = self.clean_text(row.get('position') or '')
+            company = self.clean_text(row.get('company') or '')
+            if not title or not company:
+                continue
+
+            description = self.clean_text(row.get('description') or '')
+            tags = [self.clean_text(tag) for tag in row.get('tags') or []]
+
+            all_skills = self._extract_skills_lower(description.lower())
+            all_skills.extend(
+                CANONICAL_SKILLS[tag.lower()] for tag in tags
+                if tag.lower() in CANONICAL_SKILLS
+                and CANONICAL_SKILLS[tag.lower()] not in all_skills
+            )
+
+            date_posted = (row.get('date') or '')[:10] or datetime.now().strftime('%Y-%m-%d')
+
+            jobs.append(Job(
+                title=title,
+                company=sys.intern(company),
+                location=sys.intern(self.clean_text(row.get('location') or '') or 'Remote'),
+                date_posted=sys.intern(date_posted),
+                skills=sorted(set(all_skills)),
+                source='RemoteOK',
+                description=description[:500] + "..." if len(description) > 500 else description,
+                url=row.get('url') or ''
+            ))
+        return jobs
+
+    def scrape_remoteok(self, query: str = "software", max_jobs: int = 50) -> List[Job]:
         """Scrape jobs from RemoteOK"""
         logger.info(f"Scraping RemoteOK for '{query}' (max_jobs={max_jobs})")
         jobs = []
-        session = requests.Session()
-        
+
+        # The JSON API covers the same listings without any HTML parsing;
+        # keep the table scrape below as a fallback if it fails
+        try:
+            jobs = self._scrape_remoteok_api(max_jobs)
+            if jobs:
+                logger.info(f"Fetched {len(jobs)} jobs from the RemoteOK API")
+                return jobs
+            logger.warning("RemoteOK API returned no usable rows; falling back to HTML")
+        except (requests.exceptions.RequestException, ValueError) as e:
+            logger.warning(f"RemoteOK API fetch failed ({e}); falling back to HTML")
+
         try:
-            headers = {
-                'User-Agent': 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/120.0.0.0 Safari/537.36',
-                'Accept': 'text/html,application/xhtml+xml,application/xml;q=0.9,image/webp,*/*;q=0.8',
-                'Accept-Language': 'en-US,en;q=0.9',
-                'Referer': 'https://remoteok.com/',
-            }
-            session.headers.update(headers)
-            
             # Try multiple RemoteOK URLs
             search_term = query.lower().replace(' ', '-')
             urls_to_try = [
@@ -273,13 +502,18 @@ class JobScraper:
                 logger.info(f"Trying RemoteOK URL: {url}")
                 
                 try:
-                    response = session.get(url, timeout=30)
-                    response.raise_for_status()
-                    
-                    soup = BeautifulSoup(response.content, 'html.parser')
+                    self._buckets['remoteok.com'].acquire()
+                    with self.session.get(
+                        url, timeout=30, stream=True,
+                        headers={'Referer': 'https://remoteok.com/'}
+                    ) as response:
+                        response.raise_for_status()
+                        response.raw.decode_content = True
+                        soup = BeautifulSoup(response.raw, _BS_PARSER,
+                                             parse_only=_ROK_ROW_STRAINER)
                     
                     # Find job rows
-                    job_rows = soup.select('tr.job')
+                    job_rows = _ROK_ROWS.select(soup)
                     logger.info(f"Found {len(job_rows)} job rows on RemoteOK")
                     
                     if not job_rows:
@@ -293,22 +527,18 @@ class JobScraper:
                             
                         try:
                             # Extract title
-                            title_elem = row.select_one('td.company h2')
-                            if not title_elem:
-                                title_elem = row.select_one('h2[itemprop="title"]')
+                            title_elem = _ROK_TITLE.select_one(row)
                             title = self.clean_text(title_elem.get_text() if title_elem else "")
-                            
+
                             # Extract company
-                            company_elem = row.select_one('td.company h3')
-                            if not company_elem:
-                                company_elem = row.select_one('h3[itemprop="name"]')
+                            company_elem = _ROK_COMPANY.select_one(row)
                             company = self.clean_text(company_elem.get_text() if company_elem else "")
                             
                             # Location is typically "Remote"
                             location = "Remote"
                             
                             # Extract skills from tags
-                            skill_tags = row.select('td.tags a.tag h3, td.tags span.tag h3')
+                            skill_tags = _ROK_TAGS.select(row)
                             skills = []
                             for tag in skill_tags:
                                 skill_text = self.clean_text(tag.get_text())
@@ -316,7 +546,7 @@ class JobScraper:
                                     skills.append(skill_text)
                             
                             # Extract date
-                            date_elem = row.select_one('td.time time')
+                            date_elem = _ROK_DATE.select_one(row)
                             date_posted = ""
                             if date_elem:
                                 datetime_attr = date_elem.get('datetime', '')
@@ -337,19 +567,19 @@ class JobScraper:
                                 description += f" Required skills: {', '.join(skills[:5])}."
                             
                             # Extract additional skills from description
-                            all_skills = self.extract_skills(description)
+                            all_skills = self._extract_skills_lower(description.lower())
                             all_skills.extend([s for s in skills if s not in all_skills])
                             
                             if title and company:
-                                job = {
-                                    'title': title,
-                                    'company': company,
-                                    'location': location,
-                                    'date_posted': date_posted,
-                                    'skills': sorted(list(set(all_skills))),
-                                    'source': 'RemoteOK',
-                                    'description': description
-                                }
+                                job = Job(
+                                    title=title,
+                                    company=sys.intern(company),
+                                    location=sys.intern(location),
+                                    date_posted=sys.intern(date_posted),
+                                    skills=sorted(set(all_skills)),
+                                    source='RemoteOK',
+                                    description=description
+                                )
                                 jobs.append(job)
                                 count += 1
                                 logger.debug(f"Added RemoteOK job: {title} at {company}")
@@ -364,18 +594,14 @@ class JobScraper:
                 except requests.exceptions.RequestException as e:
                     logger.error(f"Error fetching RemoteOK URL {url}: {e}")
                     continue
-            
-            self.random_delay(0.5)
-            
+
         except Exception as e:
             logger.error(f"Error scraping RemoteOK: {e}")
-        finally:
-            session.close()
-        
+
         logger.info(f"Successfully scraped {len(jobs)} jobs from RemoteOK")
         return jobs
 
-    def scrape_glassdoor_demo(self, query: str = "software engineer", location: str = "United States", count: int = 15) -> List[Dict]:
+    def scrape_glassdoor_demo(self, query: str = "software engineer", location: str = "United States", count: int = 15) -> List[Job]:
         """Demo Glassdoor data (as in original code)"""
         logger.info(f"Generating demo Glassdoor data for '{query}' in '{location}'")
         demo_companies = ["Google", "Microsoft", "Amazon", "Apple", "Meta", "Netflix", "Tesla", "Uber", "Airbnb", "Spotify"]
@@ -389,48 +615,57 @@ class JobScraper:
             ["Go", "Kubernetes", "Docker", "AWS"]
         ]
         
+        # Draw every random index in one batch instead of five generator
+        # calls per record; the dates reuse a small lookup of the 31
+        # possible strftime results
+        n = min(count, 30)
+        rng = np.random.default_rng()
+        title_idx = rng.integers(0, len(demo_titles), n)
+        company_idx = rng.integers(0, len(demo_companies), n)
+        location_idx = rng.integers(0, len(demo_locations), n)
+        skills_idx = rng.integers(0, len(demo_skills), n)
+        day_offsets = rng.integers(0, 31, n)
+
+        now = datetime.now()
+        date_strings = [(now - timedelta(days=int(d))).strftime('%Y-%m-%d')
+                        for d in range(31)]
+
         jobs = []
-        for i in range(min(count, 30)):
-            job = {
-                'title': random.choice(demo_titles),
-                'company': random.choice(demo_companies),
-                'location': random.choice(demo_locations),
-                'skills': random.choice(demo_skills),
-                'date_posted': (datetime.now() - timedelta(days=random.randint(0, 30))).strftime('%Y-%m-%d'),
-                'source': 'Glassdoor (Demo)',
-                'description': "Demo job description for testing purposes."
-            }
+        for i in range(n):
+            job = Job(
+                title=demo_titles[title_idx[i]],
+                company=demo_companies[company_idx[i]],
+                location=demo_locations[location_idx[i]],
+                skills=demo_skills[skills_idx[i]],
+                date_posted=date_strings[day_offsets[i]],
+                source='Glassdoor (Demo)',
+                description="Demo job description for testing purposes."
+            )
             jobs.append(job)
         return jobs
 
-    def scrape_all_platforms(self, query: str = "software engineer", location: str = "United States") -> List[Dict]:
+    def scrape_all_platforms(self, query: str = "software engineer", location: str = "United States") -> List[Job]:
         """Scrape jobs from all platforms with focus on LinkedIn and RemoteOK"""
         logger.info(f"Starting job scraping for '{query}' in '{location}'...")
         all_jobs = []
-        
-        # Scrape LinkedIn
-        try:
-            logger.info("--- Starting LinkedIn Scrape ---")
-            linkedin_jobs = self.scrape_linkedin_jobs(query, location, max_jobs=50)
-            all_jobs.extend(linkedin_jobs)
-            logger.info(f"--- Finished LinkedIn Scrape ({len(linkedin_jobs)} jobs) ---")
-        except Exception as e:
-            logger.error(f"LinkedIn scraping failed: {e}")
-        
-        self.random_delay()
-        
-        # Scrape RemoteOK
-        try:
-            logger.info("--- Starting RemoteOK Scrape ---")
-            remote_query = query.split()[0] if query else "software"
-            remote_jobs = self.scrape_remoteok(remote_query, max_jobs=50)
-            all_jobs.extend(remote_jobs)
-            logger.info(f"--- Finished RemoteOK Scrape ({len(remote_jobs)} jobs) ---")
-        except Exception as e:
-            logger.error(f"RemoteOK scraping failed: {e}")
-        
-        self.random_delay()
-        
+
+        # LinkedIn and RemoteOK hit different hosts, so their politeness
+        # delays don't overlap - run them on two threads and let each
+        # host's token bucket pace its own requests
+        remote_query = query.split()[0] if query else "software"
+        with ThreadPoolExecutor(max_workers=2) as pool:
+            futures = {
+                'LinkedIn': pool.submit(self.scrape_linkedin_jobs, query, location, 50),
+                'RemoteOK': pool.submit(self.scrape_remoteok, remote_query, 50),
+            }
+            for name, future in futures.items():
+                try:
+                    platform_jobs = future.result()
+                    all_jobs.extend(platform_jobs)
+                    logger.info(f"--- Finished {name} Scrape ({len(platform_jobs)} jobs) ---")
+                except Exception as e:
+                    logger.error(f"{name} scraping failed: {e}")
+
         # Add demo Glassdoor data
         try:
             logger.info("--- Adding Demo Glassdoor Data ---")
@@ -445,20 +680,19 @@ class JobScraper:
         seen = set()
         unique_jobs = []
         
+        # title/company were already cleaned at scrape time, so the key is
+        # a plain lowercase tuple - no redundant clean_text passes
         for job in all_jobs:
-            title_norm = self.clean_text(job.get('title', '')).lower()
-            company_norm = self.clean_text(job.get('company', '')).lower()
-            
-            if not title_norm or not company_norm:
+            key = (job.title.lower(), job.company.lower())
+
+            if not key[0] or not key[1]:
                 continue
-                
-            key = (title_norm, company_norm)
-            
+
             if key not in seen:
                 seen.add(key)
                 unique_jobs.append(job)
             else:
-                logger.debug(f"Duplicate removed: {title_norm} at {company_norm}")
+                logger.debug(f"Duplicate removed: {key[0]} at {key[1]}")
         
         logger.info(f"Total unique jobs scraped: {len(unique_jobs)}")
         self.jobs_data = unique_jobs
@@ -474,19 +708,15 @@ class JobScraper:
         fieldnames = ['title', 'company', 'location', 'date_posted', 'skills', 'source', 'description']
         
         try:
-            with open(filename, 'w', newline='', encoding='utf-8') as csvfile:
-                writer = csv.writer(csvfile, quoting=csv.QUOTE_ALL)
-                writer.writerow(fieldnames)
-                
-                for job in self.jobs_data:
-                    row = []
-                    for field in fieldnames:
-                        value = job.get(field, '')
-                        if field == 'skills' and isinstance(value, list):
-                            value = ', '.join(value)
-                        row.append(str(value))
-                    writer.writerow(row)
-            
+            # pandas serializes the whole table in C instead of a Python
+            # writerow call per job
+            df = pd.DataFrame((asdict(job) for job in self.jobs_data), columns=fieldnames)
+            df['skills'] = df['skills'].map(
+                lambda v: ', '.join(v) if isinstance(v, (list, tuple)) else v
+            )
+            df.fillna('').to_csv(filename, index=False, quoting=csv.QUOTE_ALL,
+                                 encoding='utf-8')
+
             logger.info(f"Data successfully saved to {filename}")
         except Exception as e:
             logger.error(f"Error saving data to CSV: {e}")
@@ -496,39 +726,38 @@ class JobScraper:
         if not self.jobs_data:
             return {'total_jobs': 0, 'source_breakdown': {}, 'top_skills': [], 'date_range': {}}
 
-        sources = [job.get('source', 'Unknown') for job in self.jobs_data]
-        source_counts = {}
-        for source in sources:
-            source_counts[source] = source_counts.get(source, 0) + 1
+        # Counter does the tallying in C instead of dict.get(k, 0) + 1 loops
+        source_counts = Counter(job.source or 'Unknown' for job in self.jobs_data)
+        skill_counts = Counter(self._iter_skills())
+        top_skills = skill_counts.most_common()
 
-        all_skills = []
+        # Single pass over the records for both date bounds
+        earliest = latest = None
         for job in self.jobs_data:
-            skills = job.get('skills', [])
-            if isinstance(skills, list):
-                all_skills.extend(skills)
-            elif isinstance(skills, str) and skills:
-                all_skills.extend([s.strip() for s in skills.split(',')])
-
-        skill_counts = {}
-        for skill in all_skills:
-            if skill:
-                skill_counts[skill] = skill_counts.get(skill, 0) + 1
-        
-        top_skills = sorted(skill_counts.items(), key=lambda x: x[1], reverse=True)
-
-        dates = [job.get('date_posted') for job in self.jobs_data if job.get('date_posted')]
-        date_range = {
-            'earliest': min(dates) if dates else None,
-            'latest': max(dates) if dates else None
-        }
+            date_posted = job.date_posted
+            if not date_posted:
+                continue
+            if earliest is None or date_posted < earliest:
+                earliest = date_posted
+            if latest is None or date_posted > latest:
+                latest = date_posted
 
         return {
             'total_jobs': len(self.jobs_data),
-            'source_breakdown': source_counts,
+            'source_breakdown': dict(source_counts),
             'top_skills': top_skills,
-            'date_range': date_range
+            'date_range': {'earliest': earliest, 'latest': latest}
         }
 
+    def _iter_skills(self):
+        """Yield every non-empty skill across the scraped jobs"""
+        for job in self.jobs_data:
+            skills = job.skills
+            if isinstance(skills, (list, tuple)):
+                yield from (s for s in skills if s)
+            elif isinstance(skills, str) and skills:
+                yield from (s.strip() for s in skills.split(',') if s.strip())
+
 def main():
     """Main function to run the scraper"""
     scraper = JobScraper()
@@ -571,20 +800,20 @@ def main():
             # Show sample jobs
             print(f"\n📝 Sample Jobs (first 5):")
             for i, job in enumerate(jobs[:5]):
-                print(f"\n{i+1}. {job.get('title', 'N/A')} at {job.get('company', 'N/A')}")
-                print(f"   Location: {job.get('location', 'N/A')}")
-                
-                skills = job.get('skills', [])
-                if isinstance(skills, list):
+                print(f"\n{i+1}. {job.title or 'N/A'} at {job.company or 'N/A'}")
+                print(f"   Location: {job.location or 'N/A'}")
+
+                skills = job.skills
+                if isinstance(skills, (list, tuple)):
                     skills_display = ", ".join(skills[:5])
                 elif isinstance(skills, str):
                     skills_display = ", ".join([s.strip() for s in skills.split(",")[:5]])
                 else:
                     skills_display = "N/A"
-                    
+
                 print(f"   Skills: {skills_display}")
-                print(f"   Date: {job.get('date_posted', 'N/A')}")
-                print(f"   Source: {job.get('source', 'N/A')}")
+                print(f"   Date: {job.date_posted or 'N/A'}")
+                print(f"   Source: {job.source or 'N/A'}")
         else:
             print("\n❌ No jobs were scraped. Check the logs for errors.")
             